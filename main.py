@@ -1,28 +1,81 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import array
+import contextlib
+import hashlib
+import hmac
+import io
+import logging
+import math
 import random
+import secrets
+import sys
+import time
 import datetime
-from typing import Union, List
+from typing import Iterator, Sequence, Union, List
+
+logger = logging.getLogger(__name__)
+
+SESSION_TTL_NS = 15 * 60 * 1_000_000_000
+
+TRANSACTION_TYPES = ("Deposit", "Withdrawal", "Transfer Out", "Transfer In", "Interest")
+_TRANSACTION_TYPE_CODES = {transaction_type: code for code, transaction_type in enumerate(TRANSACTION_TYPES)}
+
+
+_MAX_CENTS = 2 ** 63 - 1  # transaction amounts are stored in an int64 column
+
+
+def _to_cents(amount: float) -> Union[int, None]:
+    if isinstance(amount, int):
+        cents = amount * 100
+    else:
+        scaled = amount * 100
+        if not math.isfinite(scaled):
+            return None
+        cents = int(round(scaled))
+    return cents if -_MAX_CENTS <= cents <= _MAX_CENTS else None
+
+
+@contextlib.contextmanager
+def buffered_stdout() -> Iterator[None]:
+    stdout = sys.stdout
+    buffer = io.StringIO()
+    sys.stdout = buffer
+    try:
+        yield
+    finally:
+        sys.stdout = stdout
+        stdout.write(buffer.getvalue())
+        stdout.flush()
 
 
 class Transaction:
-    def __init__(self, transaction_type: str, amount: float, timestamp: datetime.datetime):
-        self.transaction_type = transaction_type
-        self.amount = amount
-        self.timestamp = timestamp
+    __slots__ = ("transaction_type", "amount", "timestamp")
+
+    def __init__(self, transaction_type: str, amount: int, timestamp: int):
+        self.transaction_type = sys.intern(transaction_type)
+        self.amount = amount  # in cents
+        self.timestamp = timestamp  # nanoseconds since the epoch, as returned by time.time_ns()
 
     def __str__(self) -> str:
-        return f"{self.timestamp} - {self.transaction_type}: ${self.amount}"
+        seconds, nanoseconds = divmod(self.timestamp, 1_000_000_000)
+        timestamp = datetime.datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000)
+        return f"{timestamp} - {self.transaction_type}: ${self.amount / 100:.2f}"
 
 
 class Bank:
     def __init__(self):
         self.customers: List[Customer] = []
-        self.active_sessions: dict[str, Customer] = {}
+        # Session token -> (customer, time.monotonic_ns() deadline)
+        self.active_sessions: dict[str, tuple[Customer, int]] = {}
+        self._customers_by_account: dict[str, Customer] = {}
+        self._next_account_number = 10000
+        self._next_session_sweep = 0
 
     def create_account(self, account_type: str = "Normal", initial_balance: float = 0) -> Customer:
-        account_number = str(random.randint(10000, 99999))
+        account_number = str(self._next_account_number)
+        self._next_account_number += 1
         if account_type == "Normal":
             account = NormalAccount(account_number, initial_balance)
         elif account_type == "Debit":
@@ -32,172 +85,256 @@ class Bank:
 
         customer = Customer(account_number, account)
         self.customers.append(customer)
+        self._customers_by_account[account_number] = customer
         return customer
 
     def authenticate_customer(self, account_number: str, pin: str) -> Union[str, None]:
-        for customer in self.customers:
-            if customer.account.account_number == account_number and customer.authenticate(pin):
-                session_token = str(random.randint(100000, 999999))
-                self.active_sessions[session_token] = customer
-                return session_token
+        customer = self._customers_by_account.get(account_number)
+        if customer is not None and customer.authenticate(pin):
+            now = time.monotonic_ns()
+            self._expire_sessions(now)
+            session = (customer, now + SESSION_TTL_NS)
+            session_token = secrets.token_hex(8)
+            while self.active_sessions.setdefault(session_token, session) is not session:
+                session_token = secrets.token_hex(8)
+            return session_token
         return None
 
+    def _expire_sessions(self, now: int) -> None:
+        if now < self._next_session_sweep:
+            return
+        expired = [token for token, session in self.active_sessions.items() if session[1] <= now]
+        for token in expired:
+            del self.active_sessions[token]
+        self._next_session_sweep = now + SESSION_TTL_NS
+
     def end_session(self, session_token: str) -> None:
-        if session_token in self.active_sessions:
-            del self.active_sessions[session_token]
-            print("Session ended successfully.")
+        session = self.active_sessions.pop(session_token, None)
+        if session is not None and session[1] > time.monotonic_ns():
+            logger.debug("Session ended successfully.")
         else:
-            print("Invalid session token.")
+            logger.warning("Invalid session token.")
 
     def get_customer(self, account_number: str) -> Union[Customer, None]:
-        for customer in self.customers:
-            if customer.account.account_number == account_number:
-                return customer
-        return None
+        return self._customers_by_account.get(account_number)
+
+    def apply_batch(self, account_numbers: Sequence[str], transaction_types: Sequence[str],
+                    amounts: Sequence[float]) -> int:
+        if not len(account_numbers) == len(transaction_types) == len(amounts):
+            raise ValueError("Batch sequences must have the same length.")
+        # Convert every amount before touching any account so a bad row cannot leave the batch half-applied.
+        cents_column = [_to_cents(amount) for amount in amounts]
+        customers_by_account = self._customers_by_account
+        applied = 0
+        for account_number, transaction_type, cents in zip(account_numbers, transaction_types, cents_column):
+            customer = customers_by_account.get(account_number)
+            if customer is None or customer.account.is_locked or cents is None or cents <= 0:
+                continue
+            account = customer.account
+            if transaction_type == "Deposit":
+                account._record_transaction(transaction_type, cents)
+                account.balance += cents
+            elif transaction_type == "Withdrawal" and cents <= account.balance:
+                account._record_transaction(transaction_type, cents)
+                account.balance -= cents
+            else:
+                continue
+            applied += 1
+        return applied
 
 
 class Account(ABC):
+    __slots__ = ("account_number", "balance", "is_locked",
+                 "_transaction_types", "_transaction_amounts", "_transaction_timestamps")
+
     def __init__(self, account_number: str, balance: float = 0) -> None:
         self.account_number = account_number
-        self.balance = balance
+        cents = _to_cents(balance)
+        if cents is None:
+            raise ValueError("Invalid initial balance.")
+        self.balance = cents  # in cents
         self.is_locked = False
-        self.transactions: List[Transaction] = []
+        # Transaction history is stored column-wise; Transaction objects are only built when iterated.
+        self._transaction_types = array.array("B")
+        self._transaction_amounts = array.array("q")
+        self._transaction_timestamps = array.array("q")
+
+    @property
+    def transactions(self) -> Iterator[Transaction]:
+        for code, amount, timestamp in zip(self._transaction_types, self._transaction_amounts,
+                                           self._transaction_timestamps):
+            yield Transaction(TRANSACTION_TYPES[code], amount, timestamp)
+
+    def _record_transaction(self, transaction_type: str, amount: int) -> None:
+        # Look up the type code and append the range-checked amount before the other columns,
+        # so a rejected type or amount cannot leave the columns out of step.
+        code = _TRANSACTION_TYPE_CODES[transaction_type]
+        self._transaction_amounts.append(amount)
+        self._transaction_timestamps.append(time.time_ns())
+        self._transaction_types.append(code)
 
     @abstractmethod
     def calculate_interest(self, rate: float) -> None:
         pass
 
     def deposit(self, amount: float) -> None:
-        if not self.is_locked and amount > 0:
-            self.balance += amount
-            self.transactions.append(Transaction("Deposit", amount, datetime.datetime.now()))
-            print(f"Deposited ${amount}. New balance: ${self.balance}")
+        cents = _to_cents(amount)
+        if not self.is_locked and cents is not None and cents > 0:
+            self._record_transaction("Deposit", cents)
+            self.balance += cents
+            logger.debug("Deposited $%.2f. New balance: $%.2f", cents / 100, self.balance / 100)
         elif self.is_locked:
-            print("Account is locked. Cannot perform transactions.")
+            logger.warning("Account is locked. Cannot perform transactions.")
         else:
-            print("Invalid deposit amount.")
+            logger.warning("Invalid deposit amount.")
 
     @abstractmethod
-    def withdraw(self, amount: float, overdraft_protection: bool = False) -> None:
+    def withdraw(self, amount: float) -> None:
         pass
 
     def get_balance(self) -> float:
-        return self.balance
+        return self.balance / 100
 
     def lock_account(self) -> None:
         self.is_locked = True
-        print("Account locked.")
+        logger.debug("Account locked.")
 
     def unlock_account(self) -> None:
         self.is_locked = False
-        print("Account unlocked.")
+        logger.debug("Account unlocked.")
 
     def view_transactions(self) -> None:
         if not self.is_locked:
-            for transaction in self.transactions:
-                print(transaction)
+            output = "\n".join(map(str, self.transactions))
+            if output:
+                sys.stdout.write(output)
+                sys.stdout.write("\n")
         else:
-            print("Account is locked. Cannot view transactions.")
+            logger.warning("Account is locked. Cannot view transactions.")
 
 
 class NormalAccount(Account):
+    __slots__ = ()
+
     def withdraw(self, amount: float, overdraft_protection: bool = False) -> None:
-        if not self.is_locked and (
-                0 < amount <= self.balance or (overdraft_protection and amount <= self.balance + 100)):
-            self.balance -= amount
-            self.transactions.append(Transaction("Withdrawal", amount, datetime.datetime.now()))
-            print(f"Withdrew ${amount}. New balance: ${self.balance}")
+        cents = _to_cents(amount)
+        if not self.is_locked and cents is not None and (
+                0 < cents <= self.balance or (overdraft_protection and 0 < cents <= self.balance + 10000)):
+            self._record_transaction("Withdrawal", cents)
+            self.balance -= cents
+            logger.debug("Withdrew $%.2f. New balance: $%.2f", cents / 100, self.balance / 100)
         elif self.is_locked:
-            print("Account is locked. Cannot perform transactions.")
+            logger.warning("Account is locked. Cannot perform transactions.")
         else:
-            print("Invalid withdrawal amount or insufficient funds.")
+            logger.warning("Invalid withdrawal amount or insufficient funds.")
 
     def calculate_interest(self, rate: float) -> None:
-        print("Normal accounts do not earn interest.")
+        logger.debug("Normal accounts do not earn interest.")
 
 
 class DebitAccount(Account):
-    def withdraw(self, amount: float, overdraft_protection: bool = False) -> None:
-        if not self.is_locked and 0 < amount <= self.balance:
-            self.balance -= amount
-            self.transactions.append(Transaction("Withdrawal", amount, datetime.datetime.now()))
-            print(f"Withdrew ${amount}. New balance: ${self.balance}")
+    __slots__ = ()
+
+    def withdraw(self, amount: float) -> None:
+        cents = _to_cents(amount)
+        if not self.is_locked and cents is not None and 0 < cents <= self.balance:
+            self._record_transaction("Withdrawal", cents)
+            self.balance -= cents
+            logger.debug("Withdrew $%.2f. New balance: $%.2f", cents / 100, self.balance / 100)
         elif self.is_locked:
-            print("Account is locked. Cannot perform transactions.")
+            logger.warning("Account is locked. Cannot perform transactions.")
         else:
-            print("Invalid withdrawal amount or insufficient funds.")
+            logger.warning("Invalid withdrawal amount or insufficient funds.")
 
     def calculate_interest(self, rate: float) -> None:
-        print("Debit accounts do not earn interest.")
+        logger.debug("Debit accounts do not earn interest.")
 
 
 class Customer:
+    __slots__ = ("account_number", "account", "pin", "_pin_salt", "_pin_hash")
+
     def __init__(self, account_number: str, account: Account) -> None:
         self.account_number = account_number
         self.account = account
         self.pin = str(random.randint(1000, 9999))
+        self._pin_salt = secrets.token_bytes(16)
+        self._pin_hash = self._hash_pin(self.pin)
+
+    def _hash_pin(self, pin: str) -> bytes:
+        return hashlib.sha256(self._pin_salt + pin.encode()).digest()
 
     def authenticate(self, entered_pin: str) -> bool:
-        return entered_pin == self.pin
+        return hmac.compare_digest(self._pin_hash, self._hash_pin(entered_pin))
 
     def transfer(self, recipient_account: Account, amount: float) -> None:
-        if not self.account.is_locked and 0 < amount <= self.account.balance:
-            self.account.withdraw(amount)
-            recipient_account.deposit(amount)
-            self.account.transactions.append(Transaction("Transfer", amount, datetime.datetime.now()))
-            print(f"Transferred ${amount} to {recipient_account.account_number}")
-        elif self.account.is_locked:
-            print("Account is locked. Cannot perform transactions.")
+        if recipient_account is self.account:
+            logger.warning("Cannot transfer to the same account.")
+            return
+        cents = _to_cents(amount)
+        if (not self.account.is_locked and not recipient_account.is_locked
+                and cents is not None and 0 < cents <= self.account.balance):
+            self.account._record_transaction("Transfer Out", cents)
+            recipient_account._record_transaction("Transfer In", cents)
+            self.account.balance -= cents
+            recipient_account.balance += cents
+            logger.debug("Transferred $%.2f to %s", cents / 100, recipient_account.account_number)
+        elif self.account.is_locked or recipient_account.is_locked:
+            logger.warning("Account is locked. Cannot perform transactions.")
         else:
-            print("Invalid transfer amount or insufficient funds.")
+            logger.warning("Invalid transfer amount or insufficient funds.")
 
 
 # Example usage:
 
-bank = Bank()
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+
+    bank = Bank()
 
-# Create customer accounts
-customer1 = bank.create_account("Normal", 1000)
-customer2 = bank.create_account("Normal", 500)
-customer3 = bank.create_account("Debit", 1500)
+    # Create customer accounts
+    customer1 = bank.create_account("Normal", 1000)
+    customer2 = bank.create_account("Normal", 500)
+    customer3 = bank.create_account("Debit", 1500)
 
-# Authenticate customers
-session_token1 = bank.authenticate_customer(customer1.account_number, customer1.pin)
-session_token2 = bank.authenticate_customer(customer2.account_number, customer2.pin)
-session_token3 = bank.authenticate_customer(customer3.account_number, customer3.pin)
+    # Authenticate customers
+    session_token1 = bank.authenticate_customer(customer1.account_number, customer1.pin)
+    session_token2 = bank.authenticate_customer(customer2.account_number, customer2.pin)
+    session_token3 = bank.authenticate_customer(customer3.account_number, customer3.pin)
 
-# Deposit and withdraw
-customer1.account.deposit(500)
-customer1.account.withdraw(200)
+    # Deposit and withdraw
+    customer1.account.deposit(500)
+    customer1.account.withdraw(200)
 
-customer2.account.deposit(1000)
-customer2.account.withdraw(200)
+    customer2.account.deposit(1000)
+    customer2.account.withdraw(200)
 
-# Transfer funds
-customer1.transfer(customer2.account, 300)
+    # Transfer funds
+    customer1.transfer(customer2.account, 300)
 
-# Check balances
-print(f"{customer1.account_number}'s balance: ${customer1.account.get_balance()}")
-print(f"{customer2.account_number}'s balance: ${customer2.account.get_balance()}")
-print(f"{customer3.account_number}'s balance: ${customer3.account.get_balance()}")
+    # Check balances
+    with buffered_stdout():
+        print(f"{customer1.account_number}'s balance: ${customer1.account.get_balance():.2f}")
+        print(f"{customer2.account_number}'s balance: ${customer2.account.get_balance():.2f}")
+        print(f"{customer3.account_number}'s balance: ${customer3.account.get_balance():.2f}")
 
-# Calculate interest
-customer1.account.calculate_interest(2.5)
-customer2.account.calculate_interest(1.5)
-customer3.account.calculate_interest(3.0)
+    # Calculate interest
+    customer1.account.calculate_interest(2.5)
+    customer2.account.calculate_interest(1.5)
+    customer3.account.calculate_interest(3.0)
 
-# Lock and unlock account
-customer1.account.lock_account()
-customer2.account.unlock_account()
+    # Lock and unlock account
+    customer1.account.lock_account()
+    customer2.account.unlock_account()
 
-# View transactions
-customer1.account.view_transactions()
-customer2.account.view_transactions()
+    # View transactions
+    with buffered_stdout():
+        customer1.account.view_transactions()
+        customer2.account.view_transactions()
 
-# Withdraw with overdraft protection (not applicable for DebitAccount)
-customer3.account.withdraw(1800, overdraft_protection=True)
+    # Withdraw more than the balance (DebitAccount has no overdraft protection)
+    customer3.account.withdraw(1800)
 
-# End sessions
-bank.end_session(session_token1)
-bank.end_session(session_token2)
-bank.end_session(session_token3)
+    # End sessions
+    bank.end_session(session_token1)
+    bank.end_session(session_token2)
+    bank.end_session(session_token3)